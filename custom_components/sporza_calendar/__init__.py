@@ -8,13 +8,20 @@ https://github.com/TimBossuyt/homeassistant-sporza
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.typing import ConfigType
 
 from .api import SporzaApiClient
-from .const import DOMAIN
+from .const import DOMAIN, SERVICE_PROFILE
 from .coordinator import SporzaCalendarDataUpdateCoordinator
+from .profiler import async_profile
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +31,21 @@ PLATFORMS = ["calendar"]
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa: ARG001
     """Set up the Sporza Calendar integration."""
     hass.data.setdefault(DOMAIN, {})
+
+    async def async_handle_profile(call: ServiceCall) -> ServiceResponse:  # noqa: ARG001
+        """Profile a full refresh and calendar queries of all loaded entries."""
+        coordinators = list(hass.data[DOMAIN].values())
+        if not coordinators:
+            message = "No Sporza Calendar entries are loaded"
+            raise HomeAssistantError(message)
+        return await async_profile(hass, coordinators)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_handle_profile,
+        supports_response=SupportsResponse.ONLY,
+    )
     return True
 
 
@@ -39,7 +61,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         sporza_api=api_client,
     )
 
-    # Fetch initial data so we have data when entities get added
+    # Fetch today's games so we have data when entities get added
     await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})
@@ -48,6 +70,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Set up all platforms for this device/entry
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Stream the rest of the week in the background, entities update per day
+    entry.async_create_background_task(
+        hass, coordinator.async_refresh(), name=f"{DOMAIN}_week_refresh"
+    )
+
     return True
 
 
@@ -2,13 +2,14 @@
 
 import json
 import logging
+from collections.abc import AsyncIterator
 from datetime import date, datetime, timedelta
 
 import aiohttp
 from homeassistant.util import dt as dt_util
 
-from .const import INTERESTED_LABELS, LABEL_OBJECT_MAPPING
 from .models import Game
+from .parsers import GAME_SPECS, GameParseError, parse_game
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,23 +21,41 @@ class SporzaApiClient:
         """Initialize the Sporza API Client."""
         self._session = session
 
-    async def async_fetch_games_coming_week(self) -> dict:
-        """Get games for the coming week."""
-        today = dt_util.now().date()
-        week_dates = [today + timedelta(days=i) for i in range(7)]
-
-        week_games = {}
-        for day in week_dates:
-            games_per_sport = await self.async_fetch_games_by_day(day)
-            week_games[day] = games_per_sport
+    async def async_stream_games_coming_week(
+        self, days: int = 7, start: int = 0
+    ) -> AsyncIterator[tuple[date, str, list[Game]]]:
+        """
+        Stream games for the coming days, starting with today.
 
-        return week_games
+        Yields (day, sport, games) tuples as soon as each sport of each day
+        has been fetched, so callers can publish today's games first.
+        The first `start` days are skipped, e.g. when they are already loaded.
+        """
+        today = dt_util.now().date()
+        for offset in range(start, days):
+            day = today + timedelta(days=offset)
+            async for sport, games in self.async_stream_games_by_day(day):
+                yield day, sport, games
 
     async def async_fetch_games_by_day(self, day: date | None) -> list[Game]:
         """
         Get games for a specific day from the Sporza API.
 
-        Returns a dictionary with sport labels as keys and Game Objects as values.
+        Returns a list of Game Objects for all interested sports.
+        """
+        all_games_for_day = []
+        async for _sport, games in self.async_stream_games_by_day(day):
+            all_games_for_day.extend(games)
+
+        return all_games_for_day
+
+    async def async_stream_games_by_day(
+        self, day: date | None
+    ) -> AsyncIterator[tuple[str, list[Game]]]:
+        """
+        Stream games for a specific day from the Sporza API.
+
+        Yields (sport, games) tuples, one per interested sport in the schedule.
         """
         if day is None:
             day = dt_util.now().date()
@@ -57,30 +76,38 @@ class SporzaApiClient:
 
         schedule = self.__parse_schedule(data)
 
-        all_games_for_day = []
         for sport, api_urls in schedule.items():
+            games = []
             for api_url in api_urls:
                 game = await self.__async_fetch_game_object_by_id(api_url, sport)
-                all_games_for_day.append(game)
-
-        return all_games_for_day
+                if game is not None:
+                    games.append(game)
+            yield sport, games
 
-    async def __async_fetch_game_object_by_id(self, api_url: str, sport: str) -> Game:
-        """Get game object by match ID."""
-        metadata = await self.__async_fetch_game_metadata_by_id(api_url)
-        match_id = metadata.get("matchId", 999)
-
-        game_cls = LABEL_OBJECT_MAPPING.get(sport)
-
-        ## Handle generic Game class (as this takes an extra argument)
-        if (not game_cls) or (game_cls is Game):
-            return Game(
-                match_id=match_id,
-                sport=sport,
-                metadata=metadata,
-            )
+    async def __async_fetch_game_object_by_id(
+        self, api_url: str, sport: str
+    ) -> Game | None:
+        """
+        Get game object by match ID.
 
-        return game_cls(match_id=match_id, metadata=metadata)
+        Returns None if the game can not be fetched or its data is malformed,
+        so only that game is dropped.
+        """
+        try:
+            metadata = await self.__async_fetch_game_metadata_by_id(api_url)
+        except aiohttp.ClientError as err:
+            _LOGGER.warning("Skipping %s game at %s: %s", sport, api_url, err)
+            return None
+        except (json.JSONDecodeError, AttributeError) as err:
+            ## Invalid JSON, or a body that is not a JSON object
+            _LOGGER.warning("Skipping malformed %s game at %s: %s", sport, api_url, err)
+            return None
+
+        try:
+            return parse_game(sport, metadata)
+        except GameParseError as err:
+            _LOGGER.warning("Skipping malformed %s game at %s: %s", sport, api_url, err)
+            return None
 
     async def __async_fetch_game_metadata_by_id(self, api_url: str) -> dict:
         """Get game metadata by match ID from the Sporza API."""
@@ -88,7 +115,7 @@ class SporzaApiClient:
             response.raise_for_status()
             text = await response.text()
             data = json.loads(text)
-            return data.get("componentProps", {})
+            return data.get("componentProps") or {}
 
     def __parse_schedule(self, data: dict) -> dict:
         """
@@ -99,7 +126,7 @@ class SporzaApiClient:
         api_urls_by_sport = {}
         for item in data["componentProps"]["data"]:
             label = item.get("label", "").lower()
-            if label in INTERESTED_LABELS:
+            if label in GAME_SPECS:
                 api_urls = []
                 for subitem in item.get("items", []):
                     component = subitem.get("componentProps") or {}
@@ -16,8 +16,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, LABEL_OBJECT_MAPPING
+from .const import DOMAIN
 from .coordinator import SporzaCalendarDataUpdateCoordinator
+from .parsers import GAME_SPECS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,7 +31,7 @@ async def async_setup_entry(
     """Set up the Sporza Calendar."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    all_sports = LABEL_OBJECT_MAPPING.keys()
+    all_sports = GAME_SPECS.keys()
 
     calendars = []
     for sport in all_sports:
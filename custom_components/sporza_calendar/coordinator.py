@@ -5,8 +5,9 @@ For more details about this integration, please refer to
 https://github.com/TimBossuyt/homeassistant-sporza
 """
 
+import asyncio
 import logging
-from datetime import timedelta
+from datetime import date, timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -14,8 +15,10 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
+from homeassistant.util import dt as dt_util
 
 from .api import SporzaApiClient
+from .models import Game
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -67,6 +70,7 @@ class SporzaCalendarDataUpdateCoordinator(DataUpdateCoordinator):
         hass: HomeAssistant,
         config_entry: ConfigEntry,
         sporza_api: SporzaApiClient,
+        days: int = 7,
     ) -> None:
         """Initialize my coordinator."""
         super().__init__(
@@ -83,15 +87,77 @@ class SporzaCalendarDataUpdateCoordinator(DataUpdateCoordinator):
             always_update=True,
         )
         self.sporza_api = sporza_api
+        self.days = days
+        ## Refreshes build on the previous data, so they must not overlap
+        self._refresh_lock = asyncio.Lock()
+        ## Day loaded by the startup refresh, not fetched again by the next one
+        self._startup_day: date | None = None
 
     async def _async_update_data(self) -> dict:
-        """Update data via the Sporza API client."""
+        """
+        Update data via the Sporza API client.
+
+        Games are streamed day by day (today first) and every completed day is
+        published to the listeners, unless its games did not change. On the
+        very first refresh only today's games are fetched, so entities can be
+        set up without waiting for the whole window; the rest is loaded by the
+        next refresh. Refreshes are serialized, as each builds on the data of
+        the previous one.
+        """
+        async with self._refresh_lock:
+            return await self._async_stream_data()
+
+    async def _async_stream_data(self) -> dict:
+        """Stream the games of the coming days into a copy of the current data."""
+        today = dt_util.now().date()
+        if self.data is None:
+            days, start = 1, 0
+            self._startup_day = today
+        else:
+            days = self.days
+            ## Today was fetched moments ago by the startup refresh
+            start = 1 if self._startup_day == today else 0
+            self._startup_day = None
+        previous = self.data or {}
+
+        # Keep the games of days that are still in range while refreshing
+        data = {day: games for day, games in previous.items() if day >= today}
+        refreshed_days: list[date] = []
+
         try:
-            _LOGGER.info("Fetching games for the coming week from Sporza API")
-            data = await self.sporza_api.async_fetch_games_coming_week()
+            _LOGGER.info(
+                "Fetching games for days %s to %s from Sporza API", start, days - 1
+            )
+            stream = self.sporza_api.async_stream_games_coming_week(days, start)
+            async for day, _sport, games in stream:
+                if not refreshed_days or refreshed_days[-1] != day:
+                    ## First chunk of a new day, so the previous day is complete
+                    if refreshed_days:
+                        self._async_publish_day(data, previous, refreshed_days[-1])
+                    refreshed_days.append(day)
+                    data[day] = []
+                data[day].extend(games)
         except Exception as exception:
             _LOGGER.exception("Error fetching data from Sporza API")
             message = f"Error fetching data from Sporza API: {exception}"
             raise UpdateFailed(message) from exception
         else:
+            ## Days without any scheduled games are not yielded by the stream
+            first_day = today + timedelta(days=start)
+            for day in previous:
+                if day >= first_day and day not in refreshed_days:
+                    data.pop(day, None)
             return data
+
+    def _async_publish_day(
+        self,
+        data: dict[date, list[Game]],
+        previous: dict[date, list[Game]],
+        day: date,
+    ) -> None:
+        """Publish the games fetched so far if the games of a day changed."""
+        if data[day] == previous.get(day):
+            return
+
+        self.data = dict(data)
+        self.async_update_listeners()
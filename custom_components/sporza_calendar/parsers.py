@@ -0,0 +1,269 @@
+"""
+Declarative parsers for the Sporza API game payloads.
+
+Every sport declares which fields its model needs, where they live in the
+match payload and how to parse them. A spec can fill several fields from one
+parsed value, so every payload value is parsed once. The specs are compiled
+once at import into extractor functions, so parsing a game is a single pass
+over its fields.
+"""
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from typing import Any
+
+from .models import (
+    BRUSSELS,
+    BasketballGame,
+    CyclingGame,
+    FormulaOneGame,
+    Game,
+    SoccerGame,
+    TennisGame,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+## Marker for fields without a default, the game is dropped when they are missing
+REQUIRED = object()
+
+SOCCER_META_TIME_INDEX = 3
+SOCCER_DURATION = timedelta(minutes=10)
+BASKETBALL_DURATION = timedelta(hours=2)
+
+
+class GameParseError(ValueError):
+    """Raised when a required field is missing from a game payload."""
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """
+    Where to find model fields in the payload and how to parse them.
+
+    Specs filling several fields have a parser returning a tuple, and a tuple
+    with a default per field.
+    """
+
+    path: tuple[str | int, ...]
+    parser: Callable[[Any], Any] | None = None
+    default: Any = None
+
+
+## Field parsers, they return None when the value can not be parsed
+
+LAST_MINUTE = time(23, 59, tzinfo=BRUSSELS)
+
+
+def _parse_clock(value: str) -> time | None:
+    """Parse a HH:MM string into a time in the Sporza timezone."""
+    try:
+        hour, minute = map(int, value.split(":"))
+        return time(hour, minute, tzinfo=BRUSSELS)
+    except ValueError:
+        return None
+
+
+def _parse_label(label: str) -> tuple[time | None, str]:
+    """Parse the time and location of a label like '13:30 Brasschaat'."""
+    time_part, separator, location = label.partition(" ")
+    return _parse_clock(time_part), location if separator else label
+
+
+def _parse_label_time(label: str) -> time | None:
+    """Parse the time of a label like '15:00 '."""
+    return _parse_clock(label.partition(" ")[0])
+
+
+def _parse_basketball_times(label: str) -> tuple[time | None, time | None]:
+    """Parse the start and end time of a label like '29/06 15:00'."""
+    start = _parse_clock(label.rsplit(" ", 1)[-1])
+    return start, _end_time(start, BASKETBALL_DURATION)
+
+
+def _parse_soccer_times(meta: str) -> tuple[time | None, time | None]:
+    """Parse the start and end time of a meta like 'Cup - 23/06/25 - 21:01'."""
+    parts = meta.split(" - ")
+    if len(parts) > SOCCER_META_TIME_INDEX:
+        start = _parse_clock(parts[SOCCER_META_TIME_INDEX])
+        if start:
+            return start, _end_time(start, SOCCER_DURATION)
+    _LOGGER.warning("Failed to parse times from meta: %s, using default times", meta)
+    return None, None
+
+
+def _end_time(start: time | None, duration: timedelta) -> time | None:
+    """
+    Add a duration to a start time.
+
+    Games are shown on a single day, so the end is clamped to 23:59 instead
+    of wrapping around midnight to before the start.
+    """
+    if start is None:
+        return None
+    start_dt = datetime.combine(datetime(2000, 1, 1, tzinfo=BRUSSELS), start)
+    end_dt = start_dt + duration
+    if end_dt.date() != start_dt.date():
+        return LAST_MINUTE
+    return end_dt.timetz()
+
+
+## Field specs per sport label, keyed by model field name(s)
+
+_COMMON_FIELDS = {
+    "match_id": FieldSpec(("matchId",), default=REQUIRED),
+    "competition_name": FieldSpec(("competitionName",), default=""),
+    "url": FieldSpec(("url",), default=""),
+}
+
+GAME_SPECS: dict[str, tuple[type[Game], dict[str | tuple[str, ...], FieldSpec]]] = {
+    "basketbal": (
+        BasketballGame,
+        {
+            **_COMMON_FIELDS,
+            "home_team": FieldSpec(("home", 0, "name"), default=REQUIRED),
+            "away_team": FieldSpec(("away", 0, "name"), default=REQUIRED),
+            ("starts_at", "ends_at"): FieldSpec(
+                ("label",), _parse_basketball_times, default=(None, None)
+            ),
+        },
+    ),
+    "wielrennen": (
+        CyclingGame,
+        {
+            **_COMMON_FIELDS,
+            "stage_name": FieldSpec(("stage",), default=""),
+            "game_type": FieldSpec(("type",), default=""),
+            ("starts_at", "start_location"): FieldSpec(
+                ("startLabel",), _parse_label, default=(None, "Onbekend")
+            ),
+            ("ends_at", "finish_location"): FieldSpec(
+                ("endLabel",), _parse_label, default=(None, "Onbekend")
+            ),
+        },
+    ),
+    "formule1": (
+        FormulaOneGame,
+        {
+            **_COMMON_FIELDS,
+            "location": FieldSpec(("location",), default=""),
+            "rounds": FieldSpec(("rounds",)),
+            "starts_at": FieldSpec(("startLabel",), _parse_label_time),
+            "ends_at": FieldSpec(("endLabel",), _parse_label_time),
+        },
+    ),
+    "tennis": (
+        TennisGame,
+        {
+            **_COMMON_FIELDS,
+            "home_player": FieldSpec(("home", 0, "name"), default=REQUIRED),
+            "away_player": FieldSpec(("away", 0, "name"), default=REQUIRED),
+        },
+    ),
+    "voetbal": (
+        SoccerGame,
+        {
+            **_COMMON_FIELDS,
+            "home_team": FieldSpec(("home", "name"), default=REQUIRED),
+            "away_team": FieldSpec(("away", "name"), default=REQUIRED),
+            ("starts_at", "ends_at"): FieldSpec(
+                ("meta",), _parse_soccer_times, default=(None, None)
+            ),
+        },
+    ),
+}
+
+
+## Compilation of the specs into extractor functions
+
+
+def _compile_field(
+    names: str | tuple[str, ...], spec: FieldSpec
+) -> Callable[[dict, dict], None]:
+    """Compile a field spec into a function extracting its field(s) from a payload."""
+    path = spec.path
+    parser = spec.parser
+    default = spec.default
+
+    def lookup(payload: dict) -> Any:
+        value = payload
+        try:
+            for key in path:
+                value = value[key]
+        except (KeyError, IndexError, TypeError):
+            return None
+
+        if value is not None and parser is not None:
+            try:
+                return parser(value)
+            except (AttributeError, TypeError):
+                ## Unexpected type in the payload, e.g. a number for a label
+                return None
+        return value
+
+    def missing(name: str) -> GameParseError:
+        return GameParseError(f"Missing required field '{name}' at {path}")
+
+    if isinstance(names, str):
+
+        def extract(payload: dict, fields: dict) -> None:
+            value = lookup(payload)
+            if value is None:
+                if default is REQUIRED:
+                    raise missing(names)
+                value = default
+            fields[names] = value
+
+        return extract
+
+    names_defaults = tuple(zip(names, default, strict=True))
+
+    def extract_many(payload: dict, fields: dict) -> None:
+        values = lookup(payload) or (None,) * len(names_defaults)
+        for (name, field_default), value in zip(names_defaults, values, strict=True):
+            if value is not None:
+                fields[name] = value
+            elif field_default is REQUIRED:
+                raise missing(name)
+            else:
+                fields[name] = field_default
+
+    return extract_many
+
+
+def _compile_game(
+    sport: str,
+    game_cls: type[Game],
+    specs: dict[str | tuple[str, ...], FieldSpec],
+) -> Callable[[dict], Game]:
+    """Compile the field specs of a sport into a function building its model."""
+    extractors = tuple(_compile_field(names, spec) for names, spec in specs.items())
+
+    def build(payload: dict) -> Game:
+        fields = {}
+        for extract in extractors:
+            extract(payload, fields)
+        return game_cls(sport=sport, **fields)
+
+    return build
+
+
+GAME_PARSERS: dict[str, Callable[[dict], Game]] = {
+    sport: _compile_game(sport, game_cls, fields)
+    for sport, (game_cls, fields) in GAME_SPECS.items()
+}
+
+
+def parse_game(sport: str, payload: dict) -> Game:
+    """
+    Build the game model of a sport from its match payload.
+
+    Sports without specs fall back to the generic Game class.
+    Raises GameParseError when a required field is missing.
+    """
+    build = GAME_PARSERS.get(sport)
+    if build is None:
+        return Game(match_id=payload.get("matchId", 999), sport=sport)
+    return build(payload)
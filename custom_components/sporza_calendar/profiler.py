@@ -0,0 +1,275 @@
+"""
+On-demand profiler for Sporza Calendar integration.
+
+For more details about this integration, please refer to
+https://github.com/TimBossuyt/homeassistant-sporza
+"""
+
+import cProfile
+import io
+import logging
+import pstats
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import timedelta
+from functools import partial
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .calendar import SporzaCalendar
+from .coordinator import SporzaCalendarDataUpdateCoordinator
+from .parsers import GAME_SPECS
+
+_LOGGER = logging.getLogger(__name__)
+
+TOP_FUNCTIONS = 30
+TOP_ALLOCATIONS = 20
+TRACEBACK_FRAMES = 10
+
+## Calendar range queries to profile, as (name, start offset, end offset)
+RANGE_QUERIES = [
+    ("today", timedelta(0), timedelta(days=1)),
+    ("week", timedelta(0), timedelta(days=7)),
+    ("month", timedelta(days=-7), timedelta(days=30)),
+]
+
+
+def _is_json_decode(func: tuple[str, int, str]) -> bool:
+    """Return True if the function decodes JSON."""
+    filename, _, name = func
+    return name == "loads" and Path(filename).parent.name == "json"
+
+
+def _is_model_construction(func: tuple[str, int, str]) -> bool:
+    """Return True if the function parses a game model."""
+    filename, _, name = func
+    path = Path(filename)
+    return (
+        name == "parse_game"
+        and path.name == "parsers.py"
+        and path.parent.name == "sporza_calendar"
+    )
+
+
+def _is_events_in_range(func: tuple[str, int, str]) -> bool:
+    """Return True if the function builds calendar events."""
+    return func[2] == "_get_events_in_range"
+
+
+## CPU phases, measured as the time spent entering the phase from outside it
+PHASES: dict[str, Callable[[tuple[str, int, str]], bool]] = {
+    "json_decode": _is_json_decode,
+    "model_construction": _is_model_construction,
+    "events_in_range": _is_events_in_range,
+}
+
+
+def _enable_profiler(profiler: cProfile.Profile) -> None:
+    """Enable a profiler, failing if another profiler is already active."""
+    try:
+        profiler.enable()
+    except ValueError as err:
+        message = f"Unable to profile Sporza Calendar: {err}"
+        raise HomeAssistantError(message) from err
+
+
+def _phase_time(
+    stats: pstats.Stats, matcher: Callable[[tuple[str, int, str]], bool]
+) -> float:
+    """
+    Return the cumulative time spent in a phase.
+
+    Only calls coming from outside the phase are counted, so nested calls
+    (e.g. a subclass __init__ calling its parent) are not counted twice.
+    """
+    total = 0.0
+    for func, (_, _, _, _, callers) in stats.stats.items():  # type: ignore[attr-defined]
+        if not matcher(func):
+            continue
+        for caller, (_, _, _, cumulative) in callers.items():
+            if not matcher(caller):
+                total += cumulative
+    return total
+
+
+async def async_profile(
+    hass: HomeAssistant, coordinators: list[SporzaCalendarDataUpdateCoordinator]
+) -> dict:
+    """
+    Profile one full refresh and a set of calendar range queries.
+
+    Writes a report to the config directory and returns a summary. The
+    profilers cover the whole event loop while the refresh awaits the network,
+    so CPU time of other integrations running meanwhile is included.
+    """
+    refresh_profiler = cProfile.Profile()
+    query_profiler = cProfile.Profile()
+
+    ## Allocations are reported relative to a baseline, so they only cover this
+    ## run, also when tracemalloc was already tracing for someone else
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start(TRACEBACK_FRAMES)
+
+    try:
+        baseline = await hass.async_add_executor_job(tracemalloc.take_snapshot)
+
+        ## Full refresh, network waits show up as wall time not spent on CPU
+        refresh_start = time.perf_counter()
+        _enable_profiler(refresh_profiler)
+        try:
+            for coordinator in coordinators:
+                await coordinator.async_refresh()
+        finally:
+            refresh_profiler.disable()
+        refresh_duration = time.perf_counter() - refresh_start
+
+        ## Calendar range queries, on temporary entities for every sport
+        query_start = time.perf_counter()
+        events = 0
+        now = dt_util.now()
+        _enable_profiler(query_profiler)
+        try:
+            for coordinator in coordinators:
+                for sport in GAME_SPECS:
+                    calendar = SporzaCalendar(coordinator, sport)
+                    for _, start_offset, end_offset in RANGE_QUERIES:
+                        events += len(
+                            await calendar.async_get_events(
+                                hass, now + start_offset, now + end_offset
+                            )
+                        )
+        finally:
+            query_profiler.disable()
+        query_duration = time.perf_counter() - query_start
+
+        ## The peak is only specific to this run if we started tracing
+        peak_memory = tracemalloc.get_traced_memory()[1] if started_tracing else None
+
+        refresh_success = {
+            _coordinator_key(coordinator): coordinator.last_update_success
+            for coordinator in coordinators
+        }
+        games = sum(
+            len(day_games)
+            for coordinator in coordinators
+            for day_games in (coordinator.data or {}).values()
+        )
+        filename = f"sporza_calendar_profile_{now.strftime('%Y%m%d_%H%M%S')}.txt"
+
+        ## Snapshots, statistics and the report are heavy, keep them off the loop
+        summary = await hass.async_add_executor_job(
+            partial(
+                _write_report,
+                Path(hass.config.path(filename)),
+                baseline=baseline,
+                refresh_profiler=refresh_profiler,
+                query_profiler=query_profiler,
+                durations={
+                    "refresh": refresh_duration,
+                    "calendar_queries": query_duration,
+                },
+                refresh_success=refresh_success,
+                games=games,
+                events=events,
+            )
+        )
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+    _LOGGER.info("Sporza Calendar profile written to %s", summary["report"])
+    if not all(refresh_success.values()):
+        _LOGGER.warning("Sporza Calendar profile ran with a failed refresh")
+
+    summary["peak_memory_kib"] = (
+        round(peak_memory / 1024, 1) if peak_memory is not None else None
+    )
+    return summary
+
+
+def _coordinator_key(coordinator: SporzaCalendarDataUpdateCoordinator) -> str:
+    """Return a key identifying a coordinator in the summary."""
+    if coordinator.config_entry is not None:
+        return coordinator.config_entry.entry_id
+    return coordinator.name
+
+
+def _write_report(  # noqa: PLR0913
+    report_path: Path,
+    *,
+    baseline: tracemalloc.Snapshot,
+    refresh_profiler: cProfile.Profile,
+    query_profiler: cProfile.Profile,
+    durations: dict[str, float],
+    refresh_success: dict[str, bool],
+    games: int,
+    events: int,
+) -> dict:
+    """
+    Build the report of a profiling run and write it to a file.
+
+    Runs in the executor, as it snapshots all traced memory and sorts the
+    profiler statistics. Returns the summary of the run.
+    """
+    trace_filters = [
+        tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__)
+    ]
+    snapshot = tracemalloc.take_snapshot().filter_traces(trace_filters)
+    allocations = snapshot.compare_to(baseline.filter_traces(trace_filters), "lineno")
+
+    refresh_stats = pstats.Stats(refresh_profiler)
+    query_stats = pstats.Stats(query_profiler)
+    refresh_cpu = refresh_stats.total_tt  # type: ignore[attr-defined]
+
+    phases = {
+        "refresh": durations["refresh"],
+        "network_wait": max(durations["refresh"] - refresh_cpu, 0.0),
+        "calendar_queries": durations["calendar_queries"],
+    }
+    for phase, matcher in PHASES.items():
+        phases[phase] = _phase_time(refresh_stats, matcher) + _phase_time(
+            query_stats, matcher
+        )
+
+    report = io.StringIO()
+
+    report.write("Sporza Calendar profile\n")
+    report.write(f"Games: {games}, calendar events: {events}\n")
+    for key, success in refresh_success.items():
+        report.write(f"Refresh {key}: {'succeeded' if success else 'FAILED'}\n")
+    report.write(
+        "\nThe profilers cover the whole event loop, so the refresh CPU time and\n"
+        "top functions include other integrations running during the refresh.\n\n"
+    )
+
+    report.write("Per-phase timings (seconds)\n")
+    report.write(
+        "network_wait is approximate: refresh wall time minus profiled CPU time\n"
+    )
+    for phase, duration in phases.items():
+        report.write(f"  {phase:<20} {duration:.4f}\n")
+
+    for title, stats in (("refresh", refresh_stats), ("queries", query_stats)):
+        report.write(f"\nTop functions ({title}, by cumulative time)\n")
+        stats.stream = report  # type: ignore[attr-defined]
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+
+    report.write("\nTop allocation sites (compared to before the run)\n")
+    for stat in allocations[:TOP_ALLOCATIONS]:
+        report.write(f"  {stat}\n")
+
+    report_path.write_text(report.getvalue(), "utf-8")
+
+    return {
+        "report": str(report_path),
+        "refresh_success": refresh_success,
+        "games": games,
+        "events": events,
+        "allocated_kib": round(sum(stat.size_diff for stat in allocations) / 1024, 1),
+        "phases": {phase: round(duration, 4) for phase, duration in phases.items()},
+    }
@@ -0,0 +1,481 @@
+# ruff: noqa: INP001
+"""
+Scale test for the Sporza Calendar integration.
+
+Inflates the response samples in docs/response_samples to tournament-scale
+days and drives the API client, the calendar coordinator and many calendar
+entities together against a fake HTTP session. Reports throughput, latency
+percentiles and memory per scale, and flags anything that grows worse than
+linear with the number of games, matches per day or days in the window.
+
+Run it through scripts/loadtest, see --help for the options.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import partial
+from pathlib import Path
+from typing import Self
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.sporza_calendar.api import SporzaApiClient
+from custom_components.sporza_calendar.calendar import SporzaCalendar
+from custom_components.sporza_calendar.coordinator import (
+    SporzaCalendarDataUpdateCoordinator,
+)
+from custom_components.sporza_calendar.parsers import GAME_SPECS
+
+SAMPLES_DIR = Path(__file__).parent.parent / "docs" / "response_samples"
+SCHEDULE_URL = "https://api.sporza.be/web/content/schedule"
+MATCH_URL = "https://api.sporza.be/web/content/{label}/matches/{match_id}"
+
+MATCH_ID = "__MATCH_ID__"
+CLOCK = "__CLOCK__"
+END_CLOCK = "__END_CLOCK__"
+
+## Sample file per label, with a function putting the clock placeholders into
+## the fields the start and end times are parsed from
+SAMPLES = {
+    "basketbal": ("basketball.json", lambda props: props.update(label=CLOCK)),
+    "wielrennen": (
+        "cycling.json",
+        lambda props: props.update(
+            startLabel=f"{CLOCK} Brasschaat", endLabel=f"{END_CLOCK} Brasschaat"
+        ),
+    ),
+    "formule1": (
+        "formula1.json",
+        lambda props: props.update(startLabel=f"{CLOCK} ", endLabel=f"{END_CLOCK} "),
+    ),
+    "tennis": ("tennis.json", lambda _: None),
+    "voetbal": (
+        "soccer.json",
+        lambda props: props.update(
+            meta=f"Wereldbeker - speeldag 1 - 01/01/26 - {CLOCK}"
+        ),
+    ),
+}
+
+## Growth exponent above which a metric is reported as worse than linear,
+## leaving some room for measurement noise
+SUPERLINEAR_EXPONENT = 1.25
+
+
+class FakeResponse:
+    """Response of the fake session."""
+
+    def __init__(self, text: str, latency: float) -> None:
+        """Initialize the response with its body and latency."""
+        self._text = text
+        self._latency = latency
+
+    async def __aenter__(self) -> Self:
+        """Wait for the latency, also yielding to the event loop."""
+        await asyncio.sleep(self._latency)
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Exit the response context."""
+
+    def raise_for_status(self) -> None:
+        """Never fail, all synthetic responses are successful."""
+
+    async def text(self) -> str:
+        """Return the response body."""
+        return self._text
+
+
+class FakeSession:
+    """Fake aiohttp session serving inflated response samples."""
+
+    def __init__(self, matches_per_day: int, latency: float) -> None:
+        """Load the samples and turn them into templates."""
+        self.matches_per_day = matches_per_day
+        self.latency = latency
+        self.requests = 0
+        self._templates = {}
+        for label, (filename, add_placeholders) in SAMPLES.items():
+            sample = json.loads((SAMPLES_DIR / filename).read_text(encoding="utf-8"))
+            props = sample["componentProps"]
+            props["matchId"] = MATCH_ID
+            add_placeholders(props)
+            self._templates[label] = json.dumps(sample)
+
+    def get(self, url: str, params: dict | None = None) -> FakeResponse:
+        """Serve the schedule or a match, like the Sporza API does."""
+        self.requests += 1
+        if url == SCHEDULE_URL:
+            text = self._schedule(params["date"])
+        else:
+            ## Match urls end with the label, 'matches' and the match id
+            parts = url.split("/")
+            text = self._match(parts[-3], parts[-1])
+        return FakeResponse(text, self.latency)
+
+    def _schedule(self, day: str) -> str:
+        """Build a schedule spreading the matches of a day over all labels."""
+        labels = list(SAMPLES)
+        items: dict[str, list] = {label: [] for label in labels}
+        for index in range(self.matches_per_day):
+            label = labels[index % len(labels)]
+            match_id = f"{day.replace('-', '')}{index:05d}"
+            url = MATCH_URL.format(label=label, match_id=match_id)
+            items[label].append({"componentProps": {"sportApiUrl": url}})
+
+        ## Like the real API, the overview repeats all matches of the day
+        overview = [item for label_items in items.values() for item in label_items]
+        data = [{"label": "alles", "type": "overview", "items": overview}]
+        data.extend(
+            {"label": label, "items": label_items}
+            for label, label_items in items.items()
+        )
+        return json.dumps({"componentProps": {"date": day, "data": data}})
+
+    def _match(self, label: str, match_id: str) -> str:
+        """Build a match from the sample of its label."""
+        ## Spread the games over the day, starting between 8:00 and 20:00
+        start = 8 * 60 + (int(match_id[-5:]) * 7) % (12 * 60)
+        end = start + 2 * 60
+        return (
+            self._templates[label]
+            .replace(MATCH_ID, match_id)
+            .replace(END_CLOCK, f"{end // 60:02d}:{end % 60:02d}")
+            .replace(CLOCK, f"{start // 60:02d}:{start % 60:02d}")
+        )
+
+
+@dataclass
+class ScaleResult:
+    """Measurements for one number of matches per day and window length."""
+
+    matches_per_day: int
+    days: int
+    games: int
+    requests: int
+    first_refresh: float
+    first_changed_day: float
+    full_refresh: float
+    publishes: int
+    query_latencies: list[float]
+    retained_memory: int
+    peak_memory: int
+
+    @property
+    def games_per_second(self) -> float:
+        """Return the throughput of the full refresh."""
+        return self.games / self.full_refresh if self.full_refresh else math.inf
+
+    def query_percentile(self, percentile: float) -> float:
+        """Return a percentile of the calendar query latencies (nearest rank)."""
+        latencies = sorted(self.query_latencies)
+        rank = math.ceil(percentile / 100 * len(latencies))
+        return latencies[max(rank, 1) - 1]
+
+
+def _evaluate_state(calendar: SporzaCalendar) -> None:
+    """
+    Stand in for writing the state of a calendar to the state machine.
+
+    Evaluates what CalendarEntity.async_write_ha_state does: the state, the
+    state attributes and the event used to schedule the next state change.
+    """
+    _ = (calendar.state, calendar.state_attributes, calendar.event)
+
+
+async def async_refresh_cycle(
+    hass: HomeAssistant,
+    matches_per_day: int,
+    days: int,
+    args: argparse.Namespace,
+) -> tuple[SporzaCalendarDataUpdateCoordinator, list[SporzaCalendar], dict]:
+    """
+    Set up a coordinator with its calendars and run a startup refresh cycle.
+
+    Returns the coordinator, its calendars and the refresh measurements.
+    """
+    session = FakeSession(matches_per_day, args.latency / 1000)
+    coordinator = SporzaCalendarDataUpdateCoordinator(
+        hass=hass,
+        config_entry=None,
+        sporza_api=SporzaApiClient(session),
+        days=days,
+    )
+    sports = list(GAME_SPECS)
+    calendars = [
+        SporzaCalendar(coordinator, sports[index % len(sports)])
+        for index in range(args.calendars)
+    ]
+
+    ## Every calendar handles coordinator updates like an entity added to HA,
+    ## only the final write to the state machine is stubbed
+    unsubscribes = []
+    for calendar in calendars:
+        calendar.async_write_ha_state = partial(_evaluate_state, calendar)
+        unsubscribes.append(
+            coordinator.async_add_listener(calendar._handle_coordinator_update)  # noqa: SLF001
+        )
+
+    publishes = 0
+    first_publish: float | None = None
+
+    def on_update() -> None:
+        nonlocal publishes, first_publish
+        publishes += 1
+        if first_publish is None:
+            first_publish = time.perf_counter()
+
+    ## Listeners are called in order, so this one runs after all calendars
+    unsubscribes.append(coordinator.async_add_listener(on_update))
+
+    ## First refresh only loads today, this is when the calendars have data
+    start = time.perf_counter()
+    await coordinator.async_refresh()
+    first_refresh = time.perf_counter() - start
+
+    ## Then the whole window is streamed, publishing every day that changed
+    publishes = 0
+    first_publish = None
+    start = time.perf_counter()
+    await coordinator.async_refresh()
+    full_refresh = time.perf_counter() - start
+    first_changed_day = (first_publish or time.perf_counter()) - start
+
+    for unsubscribe in unsubscribes:
+        unsubscribe()
+    await coordinator.async_shutdown()
+
+    if not coordinator.last_update_success:
+        message = f"Refresh failed for {matches_per_day} matches over {days} days"
+        raise RuntimeError(message)
+
+    return (
+        coordinator,
+        calendars,
+        {
+            "requests": session.requests,
+            "first_refresh": first_refresh,
+            "full_refresh": full_refresh,
+            "first_changed_day": first_changed_day,
+            "publishes": publishes,
+        },
+    )
+
+
+async def async_run_scale(
+    hass: HomeAssistant, matches_per_day: int, days: int, args: argparse.Namespace
+) -> ScaleResult:
+    """Run the refresh cycle and the calendar queries for one scale."""
+    ## Memory is measured in a separate cycle, tracemalloc slows everything down
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    traced = await async_refresh_cycle(hass, matches_per_day, days, args)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del traced
+
+    coordinator, calendars, refresh = await async_refresh_cycle(
+        hass, matches_per_day, days, args
+    )
+
+    ## Calendar views: the upcoming event, today, this week and the window
+    now = dt_util.now()
+    ranges = [
+        (now, now + timedelta(days=1)),
+        (now, now + timedelta(days=7)),
+        (now, now + timedelta(days=days)),
+    ]
+    latencies = []
+    for _ in range(args.rounds):
+        for calendar in calendars:
+            start = time.perf_counter()
+            _ = calendar.event
+            latencies.append(time.perf_counter() - start)
+            for start_date, end_date in ranges:
+                start = time.perf_counter()
+                await calendar.async_get_events(hass, start_date, end_date)
+                latencies.append(time.perf_counter() - start)
+
+    return ScaleResult(
+        matches_per_day=matches_per_day,
+        days=days,
+        games=sum(len(games) for games in coordinator.data.values()),
+        query_latencies=latencies,
+        retained_memory=retained - baseline,
+        peak_memory=peak - baseline,
+        **refresh,
+    )
+
+
+def growth_exponent(points: list[tuple[float, float]]) -> float | None:
+    """
+    Return the exponent k for which the values grow like size**k.
+
+    Fitted with least squares on a log-log scale over all (size, value)
+    points, which is less sensitive to noise than comparing two scales.
+    """
+    logs = [(math.log(size), math.log(value)) for size, value in points if value > 0]
+    mean_x = sum(x for x, _ in logs) / max(len(logs), 1)
+    mean_y = sum(y for _, y in logs) / max(len(logs), 1)
+    variance = sum((x - mean_x) ** 2 for x, _ in logs)
+    if not variance:
+        return None
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in logs)
+    return covariance / variance
+
+
+def worst_growth_exponent(
+    results: list[ScaleResult],
+    metric: Callable[[ScaleResult], float],
+    size: Callable[[ScaleResult], int],
+    group: Callable[[ScaleResult], int],
+) -> float | None:
+    """Return the highest growth exponent over the results grouped by a key."""
+    groups: dict[int, list[ScaleResult]] = {}
+    for result in results:
+        groups.setdefault(group(result), []).append(result)
+
+    exponents = [
+        exponent
+        for grouped in groups.values()
+        if (
+            exponent := growth_exponent(
+                [(size(result), metric(result)) for result in grouped]
+            )
+        )
+        is not None
+    ]
+    return max(exponents, default=None)
+
+
+def write_report(args: argparse.Namespace, results: list[ScaleResult]) -> bool:
+    """Write the report to stdout, return False if anything is superlinear."""
+    out = sys.stdout
+    out.write(
+        f"Sporza Calendar scale test: {args.calendars} calendars, "
+        f"{args.latency} ms latency\n\n"
+    )
+    out.write(
+        f"{'matches/day':>11} {'days':>4} {'games':>7} {'requests':>8} "
+        f"{'first data':>10} {'refresh':>9} {'games/s':>9} {'publishes':>9} "
+        f"{'1st change':>10} "
+        f"{'query p50':>9} {'p95':>9} {'p99':>9} {'retained':>10} {'peak':>10}\n"
+    )
+    for result in results:
+        out.write(
+            f"{result.matches_per_day:>11} {result.days:>4} {result.games:>7} "
+            f"{result.requests:>8} {result.first_refresh * 1000:>8.1f}ms "
+            f"{result.full_refresh:>8.2f}s {result.games_per_second:>9.0f} "
+            f"{result.publishes:>9} {result.first_changed_day * 1000:>8.1f}ms "
+            f"{result.query_percentile(50) * 1000:>7.2f}ms "
+            f"{result.query_percentile(95) * 1000:>7.2f}ms "
+            f"{result.query_percentile(99) * 1000:>7.2f}ms "
+            f"{result.retained_memory / 1024**2:>8.1f}MB "
+            f"{result.peak_memory / 1024**2:>8.1f}MB\n"
+        )
+
+    metrics = {
+        "first data": lambda result: result.first_refresh,
+        "full refresh": lambda result: result.full_refresh,
+        "query p50": lambda result: result.query_percentile(50),
+        "query p95": lambda result: result.query_percentile(95),
+        "retained memory": lambda result: result.retained_memory,
+    }
+    ## Growth against all games, and against one dimension with the other fixed
+    dimensions = {
+        "games": (lambda result: result.games, lambda _: 0),
+        "matches/day": (
+            lambda result: result.matches_per_day,
+            lambda result: result.days,
+        ),
+        "days": (lambda result: result.days, lambda result: result.matches_per_day),
+    }
+
+    linear = True
+    out.write("\nGrowth exponents (1.0 is linear, worst fit per fixed dimension)\n")
+    out.write(f"  {'':<16}" + "".join(f" {name:>12}" for name in dimensions) + "\n")
+    for name, metric in metrics.items():
+        line = f"  {name:<16}"
+        flagged = False
+        for size, group in dimensions.values():
+            exponent = worst_growth_exponent(results, metric, size, group)
+            if exponent is None:
+                line += f" {'-':>12}"
+                continue
+            line += f" {exponent:>12.2f}"
+            flagged |= exponent > SUPERLINEAR_EXPONENT
+        if flagged:
+            line += "  <-- worse than linear"
+            linear = False
+        out.write(line + "\n")
+
+    return linear
+
+
+def _int_list(value: str) -> list[int]:
+    """Parse a comma separated list of integers."""
+    return [int(part) for part in value.split(",")]
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--matches",
+        type=_int_list,
+        default=[25, 50, 100],
+        help="comma separated numbers of matches per day (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--days",
+        type=_int_list,
+        default=[7, 14, 28],
+        help="comma separated numbers of days to fetch (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--calendars",
+        type=int,
+        default=20,
+        help="calendar entities, spread over the sports (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=3,
+        help="calendar query rounds per entity (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="simulated network latency per request in ms (default: %(default)s)",
+    )
+    return parser.parse_args()
+
+
+async def async_main(args: argparse.Namespace) -> bool:
+    """Run the scale test for every number of matches and window length."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        results = [
+            await async_run_scale(hass, matches_per_day, days, args)
+            for days in sorted(args.days)
+            for matches_per_day in sorted(args.matches)
+        ]
+        await hass.async_stop(force=True)
+
+    return write_report(args, results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(async_main(parse_args())) else 1)